@@ -1,3 +1,5 @@
+from typing import Any as _Any, TYPE_CHECKING as _TYPE_CHECKING
+
 from . import filters as filters, utils as utils
 from .enums import *
 from .events import *
@@ -10,6 +12,22 @@ from .queue import *
 from .stats import *
 from .track import *
 
+if _TYPE_CHECKING:
+    from .pool import DefaultNodePool as DefaultNodePool
+
 __author__ = 'jay3332 & Cryptex'
 __license__ = 'MIT'
 __version__ = '0.0.0a'
+
+
+def __getattr__(name: str) -> _Any:
+    # DefaultNodePool is created lazily, so it cannot be star-imported from .pool.
+    # It is bound as a module global on first access so that later accesses skip __getattr__.
+    global DefaultNodePool
+
+    if name == 'DefaultNodePool':
+        from .pool import DefaultNodePool
+
+        return DefaultNodePool
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
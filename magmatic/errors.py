@@ -67,6 +67,8 @@ class NotFound(HTTPException):
         The aiohttp response object received from Lavalink.
     """
 
+    __slots__ = ()
+
 
 class ConnectionFailure(MagmaticException):
     """Raised when an error occurs during connection.
@@ -85,12 +87,17 @@ class ConnectionFailure(MagmaticException):
         self.node: Node = node
         self.error: Exception = error
 
-        super().__init__(f'Failed connecting to node {node.identifier!r}: {error}')
+        super().__init__(node, error)
+
+    def __str__(self) -> str:
+        return f'Failed connecting to node {self.node.identifier!r}: {self.error}'
 
 
 class HandshakeFailure(MagmaticException):
     """Raised when an error occurs during handshake."""
 
+    __slots__ = ()
+
 
 class AuthorizationFailure(MagmaticException):
     """Raised when an authorization failure occurs for a node.
@@ -106,7 +113,10 @@ class AuthorizationFailure(MagmaticException):
     def __init__(self, node: Node) -> None:
         self.node: Node = node
 
-        super().__init__(f'Invalid authorization passed for node {node.identifier!r}')
+        super().__init__(node)
+
+    def __str__(self) -> str:
+        return f'Invalid authorization passed for node {self.node.identifier!r}'
 
 
 class NodeConflict(MagmaticException):
@@ -126,7 +136,10 @@ class NodeConflict(MagmaticException):
         self.pool: NodePool = pool
         self.identifier: str = identifier
 
-        super().__init__(f'Node identifier {identifier!r} is already in use.')
+        super().__init__(pool, identifier)
+
+    def __str__(self) -> str:
+        return f'Node identifier {self.identifier!r} is already in use.'
 
 
 class NoAvailableNodes(MagmaticException):
@@ -166,14 +179,21 @@ class NoMatchingNodes(MagmaticException):
         self.identifier: Optional[str] = identifier
         self.region: Optional[str] = region
 
-        entities = []
-        if identifier is not None:
-            entities.append(f'identifier {identifier!r}')
+        super().__init__(pool, identifier, region)
 
-        if region is not None:
-            entities.append(f'voice region {region!r}')
+    def __str__(self) -> str:
+        identifier, region = self.identifier, self.region
 
-        super().__init__(f'No node with {" and ".join(entities)} could be found in this pool.')
+        if identifier is not None and region is not None:
+            entity = f'identifier {identifier!r} and voice region {region!r}'
+        elif identifier is not None:
+            entity = f'identifier {identifier!r}'
+        elif region is not None:
+            entity = f'voice region {region!r}'
+        else:
+            entity = 'no criteria'
+
+        return f'No node with {entity} could be found in this pool.'
 
 
 class PlayerNotFound(MagmaticException):
@@ -193,7 +213,10 @@ class PlayerNotFound(MagmaticException):
         self.node: Node = node
         self.guild: Snowflake = guild
 
-        super().__init__(f'Player for guild {guild!r} not found')
+        super().__init__(node, guild)
+
+    def __str__(self) -> str:
+        return f'Player for guild {self.guild!r} not found'
 
 
 class NoMatches(MagmaticException):
@@ -525,8 +525,6 @@ class Node(Generic[ClientT]):
         The discord.py client/bot instance associated with this node.
     identifier: :class:`str`
         The identifier of this node.
-    region: Optional[:class:`str`]
-        The voice region of this node.
     """
 
     URL_REGEX: ClassVar[re.Pattern[str]] = re.compile(r'^https?://(?:www\.)?.+')
@@ -555,7 +553,7 @@ class Node(Generic[ClientT]):
 
         self.bot: ClientT = bot
         self.identifier: str = identifier or os.urandom(8).hex()
-        self.region: Optional[str] = region
+        self._region: Optional[str] = region
 
         self._loop: Optional[asyncio.AbstractEventLoop] = loop
         self._connection: ConnectionManager = ConnectionManager(
@@ -574,11 +572,28 @@ class Node(Generic[ClientT]):
         self._players: Dict[int, Player[ClientT]] = {}
         self._stats: Optional[Stats] = None
 
+        # Replaced by the NodePool this node is added to
+        self._player_cleanup: Callable[[int], None] = lambda guild_id: None
+        self._region_update: Callable[[Optional[str]], None] = lambda region: None
+
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
         """:class:`asyncio.AbstractEventLoop`: The event loop associated with this node."""
         return self.bot.loop if self._loop is None else self._loop
 
+    @property
+    def region(self) -> Optional[str]:
+        """Optional[:class:`str`]: The voice region of this node.
+
+        This can be reassigned, in which case the node's pool is updated accordingly.
+        """
+        return self._region
+
+    @region.setter
+    def region(self, value: Optional[str]) -> None:
+        self._region = value
+        self._region_update(value)
+
     @property
     def connection(self) -> ConnectionManager:
         """:class:`ConnectionManager`: The :class:`ConnectionManager` managing this node's connection with Lavalink."""
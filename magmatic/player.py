@@ -46,7 +46,7 @@ class Player(VoiceProtocol, Generic[ClientT]):
 
     This class inherits from :class:`discord.VoiceProtocol`. If this is directly constructed
     (likely using the ``cls`` kwarg in :meth:`Connectable.connect <discord.abc.Connectable.connect>`),
-    a node will be pulled from the :ref:`DefaultNodePool` and the player will be added to it.
+    a node will be pulled from the :ref:`DefaultNodePool` (created on first use) and the player will be added to it.
 
     If you would like this player to be on a specific node (which in consequence could also be in a sepcific NodePool),
     see :meth:`.Node.connect` (or the two get_player methods listed above if you don't want to immediately connect).
@@ -409,6 +409,7 @@ class Player(VoiceProtocol, Generic[ClientT]):
             await self.node.connection.send_destroy(guild_id=self.guild_id)
 
             self.node._players.pop(self.guild_id, None)
+            self.node._player_cleanup(self.guild_id)
             self.cleanup()
 
     async def play(
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import operator
 
-from typing import Any, Coroutine, Dict, Final, Generic, Iterator, List, Optional, TYPE_CHECKING, Type, TypeVar, Union
+from typing import Any, Callable, Coroutine, Dict, Generic, Iterator, List, Optional, TYPE_CHECKING, Type, TypeVar, Union, ValuesView
 
+from aiohttp import ClientSession, TCPConnector
 from discord import Client
-from discord.utils import copy_doc
 
 from .errors import NoAvailableNodes, NoMatchingNodes, NodeConflict, PlayerNotFound
 from .node import JSONSerializer, Node
@@ -25,16 +27,18 @@ else:
     import json
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
     from discord.abc import Snowflake
 
     PlayerT = TypeVar('PlayerT', bound=Player[Any])
 
 ClientT = TypeVar('ClientT', bound=Client)
 
+_PLAYER_COUNT = operator.attrgetter('player_count')
+
+log: logging.Logger = logging.getLogger(__name__)
+
 __all__ = (
     'NodePool',
-    'DefaultNodePool',
     'add_node',
     'create_node',
     'start_node',
@@ -48,27 +52,87 @@ class NodePool(Generic[ClientT]):
 
     By default, a default node pool (:ref:`DefaultNodePool`) is created, however
     you can construct these yourself.
+
+    Nodes created through this pool without an explicit ``session`` share a single
+    :class:`aiohttp.ClientSession`, which is closed when the pool is destroyed.
+
+    .. note::
+        Each node's WebSocket connection to Lavalink permanently holds one of the shared
+        session's connections, so the limits below also count those WebSockets.
+        For example, with a ``connection_limit`` of ``10``, at most 9 nodes may share the
+        session so that at least one connection is left for REST requests.
+
+    Parameters
+    ----------
+    connection_limit: :class:`int`
+        The maximum number of simultaneous connections the shared session may open,
+        including node WebSockets. ``0`` means no limit. Defaults to ``100``.
+    connection_limit_per_host: :class:`int`
+        The maximum number of simultaneous connections the shared session may open
+        to a single host, including the WebSocket of the node on that host.
+        ``0`` means no per-host limit. Defaults to ``0``.
+
+    Raises
+    ------
+    ValueError
+        One of the limits is ``1``, which would leave no room for REST requests
+        next to a node's WebSocket.
     """
 
-    __slots__ = ('_nodes',)
+    __slots__ = (
+        '_nodes',
+        '_nodes_values',
+        '_nodes_get',
+        '_nodes_len',
+        '_by_region',
+        '_player_node_cache',
+        '_session',
+        '_session_loop',
+        '_connection_limit',
+        '_connection_limit_per_host',
+    )
+
+    def __init__(self, *, connection_limit: int = 100, connection_limit_per_host: int = 0) -> None:
+        if connection_limit == 1 or connection_limit_per_host == 1:
+            raise ValueError('connection limits must be 0 (unlimited) or at least 2 to leave room for REST requests')
 
-    def __init__(self) -> None:
         self._nodes: Dict[str, Node] = {}
 
+        # Bound once here since these are used in hot paths such as get_player
+        self._nodes_values: Callable[[], ValuesView[Node]] = self._nodes.values
+        self._nodes_get: Callable[[str], Optional[Node]] = self._nodes.get
+        self._nodes_len: Callable[[], int] = self._nodes.__len__
+
+        self._by_region: Dict[Optional[str], List[Node]] = {}
+        self._player_node_cache: Dict[int, Node] = {}
+
+        self._session: Optional[ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connection_limit: int = connection_limit
+        self._connection_limit_per_host: int = connection_limit_per_host
+
     @property
     def nodes(self) -> List[Node]:
         """list[:class:`Node`]: A list of nodes in the pool."""
-        return list(self.walk_nodes())
+        return list(self._nodes_values())
+
+    @property
+    def nodes_view(self) -> ValuesView[Node]:
+        """ValuesView[:class:`Node`]: A live, read-only view of the nodes in the pool.
+
+        Unlike :attr:`nodes`, this does not copy the nodes into a new list.
+        """
+        return self._nodes_values()
 
     def walk_nodes(self) -> Iterator[Node]:
         """Walks over all nodes in the pool.
 
-        Yields
-        ------
-        :class:`Node`
-            A node in the pool.
+        Returns
+        -------
+        Iterator[:class:`Node`]
+            An iterator over the nodes in the pool.
         """
-        yield from self._nodes.values()
+        return iter(self._nodes_values())
 
     def add_node(self, node: Node[ClientT], *, identifier: Optional[str] = None) -> None:
         """Adds an existing node to the pool.
@@ -84,11 +148,10 @@ class NodePool(Generic[ClientT]):
         if identifier is None:
             identifier = node.identifier
 
-        if identifier in self._nodes:
+        if self._nodes.setdefault(identifier, node) is not node:
             raise NodeConflict(self, identifier)
 
-        self._nodes[identifier or node.identifier] = node
-        self._inject_cleanup(node)
+        self._index_node(node, identifier)
 
     def create_node(
         self,
@@ -129,7 +192,11 @@ class NodePool(Generic[ClientT]):
             A completely random identifier will be generated if this is left blank,
             unless if this is the first node in the pool. Then it will default to ``'MAIN'``.
         session: :class:`aiohttp.ClientSession`
-            The aiohttp session to use for the node. Leave blank to generate one automatically.
+            The aiohttp session to use for the node.
+            Leave blank to use the session shared by all nodes in this pool.
+
+            If ``loop`` is given and differs from the event loop the shared session runs on,
+            the node creates its own session instead.
         loop: :class:`asyncio.AbstractEventLoop`
             The event loop to use for the node.
 
@@ -160,6 +227,8 @@ class NodePool(Generic[ClientT]):
         ------
         NodeConflict
             The node identifier is already in use.
+        ValueError
+            Sharing the pool's session with another node would exceed its ``connection_limit``.
         """
         if identifier is None and not self._nodes:
             identifier = 'MAIN'
@@ -167,6 +236,17 @@ class NodePool(Generic[ClientT]):
         if identifier is not None and identifier in self._nodes:
             raise NodeConflict(self, identifier)
 
+        if session is None:
+            session = self._get_session(loop)
+
+            if session is not None and self._connection_limit:
+                sharing = sum(1 for node in self._nodes_values() if node.connection.session is session)
+
+                if sharing + 1 >= self._connection_limit:
+                    raise ValueError(
+                        f'connection_limit of {self._connection_limit} is too low for {sharing + 1} nodes sharing a session'
+                    )
+
         node = Node(
             bot=bot,
             host=host,
@@ -181,8 +261,10 @@ class NodePool(Generic[ClientT]):
             resume=resume,
             serializer=serializer,
         )
-        self._inject_cleanup(node)
-        self._nodes[node.identifier] = node
+        if self._nodes.setdefault(node.identifier, node) is not node:
+            raise NodeConflict(self, node.identifier)
+
+        self._index_node(node, node.identifier)
         return node
 
     async def start_node(
@@ -226,7 +308,11 @@ class NodePool(Generic[ClientT]):
             A completely random identifier will be generated if this is left blank,
             unless if this is the first node in the pool. Then it will default to ``'MAIN'``.
         session: :class:`aiohttp.ClientSession`
-            The aiohttp session to use for the node. Leave blank to generate one automatically.
+            The aiohttp session to use for the node.
+            Leave blank to use the session shared by all nodes in this pool.
+
+            If ``loop`` is given and differs from the event loop the shared session runs on,
+            the node creates its own session instead.
         loop: :class:`asyncio.AbstractEventLoop`
             The event loop to use for the node.
 
@@ -278,6 +364,9 @@ class NodePool(Generic[ClientT]):
     def get_node(self, identifier: Optional[str] = None, *, region: Optional[str] = None) -> Node[ClientT]:
         """Gets the least loaded node from this pool that has the given identifier and/or region.
 
+        If multiple nodes are tied for the least amount of players, the one that was
+        added to the pool first is returned.
+
         Parameters
         ----------
         identifier: :class:`str`
@@ -301,19 +390,22 @@ class NodePool(Generic[ClientT]):
             raise NoAvailableNodes(self)
 
         if identifier is not None:
-            try:
-                return self._nodes[identifier]
-            except KeyError:
+            node = self._nodes_get(identifier)
+            if node is None:
                 raise NoMatchingNodes(self, identifier, region)
 
+            return node
+
         if region is not None:
-            nodes = (node for node in self.walk_nodes() if node.region == region)
+            nodes = self._by_region.get(region)
+            if not nodes:
+                raise NoMatchingNodes(self, identifier, region)
         else:
-            nodes = self.walk_nodes()
+            nodes = self._nodes_values()
 
         try:
-            return sorted(nodes, key=lambda node: node.player_count)[0]
-        except IndexError:
+            return min(nodes, key=_PLAYER_COUNT)
+        except ValueError:
             raise NoMatchingNodes(self, identifier, region)
 
     def get_player(
@@ -353,15 +445,32 @@ class NodePool(Generic[ClientT]):
             The player for the guild.
         """
         if node is None:
-            for node in self.walk_nodes():
+            cached = self._player_node_cache.get(guild.id)
+            if cached is not None:
                 try:
-                    return node.get_player(guild, cls=cls, fail_if_not_exists=True)
+                    return cached.get_player(guild, cls=cls, fail_if_not_exists=True)
+                except PlayerNotFound:
+                    # Stale entry, e.g. the player was removed without going through Player.destroy
+                    del self._player_node_cache[guild.id]
+
+            for node in self._nodes_values():
+                try:
+                    player = node.get_player(guild, cls=cls, fail_if_not_exists=True)
                 except PlayerNotFound:
                     continue
 
+                self._player_node_cache[guild.id] = node
+                return player
+
             node = self.get_node()
 
-        return node.get_player(guild, cls=cls)
+        player = node.get_player(guild, cls=cls)
+
+        # The given node could belong to another pool
+        if self._nodes_get(node.identifier) is node:
+            self._player_node_cache[guild.id] = node
+
+        return player
 
     async def destroy_node(self, node: Union[Node[ClientT], str]) -> None:
         """|coro|
@@ -389,26 +498,120 @@ class NodePool(Generic[ClientT]):
         Clears all nodes from this pool, disconnecting each of them.
 
         This is useful to be called in :meth:`Client.close <discord.Client.close>`.
+
+        Nodes are destroyed concurrently. A node that fails to be destroyed
+        will not prevent the others from being destroyed.
         """
-        for node in self.walk_nodes():
-            await node.destroy()
+        nodes = list(self._nodes_values())
+        results = await asyncio.gather(*(node.destroy() for node in nodes), return_exceptions=True)
+
+        for node, result in zip(nodes, results):
+            if isinstance(result, BaseException):
+                log.error(f'[Node {node.identifier!r}]: Failed to destroy node: {result}')
 
         self._nodes.clear()
+        self._by_region.clear()
+        self._player_node_cache.clear()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._session_loop = None
+
+    def _get_session(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[ClientSession]:
+        # Returns None if a node on the given loop cannot share the session, in which case it creates its own
+        if self._session is None or self._session.closed:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                return None
+
+            if loop is not None and loop is not running:
+                return None
+
+            connector = TCPConnector(limit=self._connection_limit, limit_per_host=self._connection_limit_per_host)
+            self._session = ClientSession(connector=connector)
+            self._session_loop = running
 
-    def _inject_cleanup(self, node: Node[ClientT]) -> None:
+        elif loop is not None and loop is not self._session_loop:
+            return None
+
+        return self._session
+
+    def _index_node(self, node: Node[ClientT], identifier: str) -> None:
+        region = node.region
+        self._by_region.setdefault(region, []).append(node)
+        self._inject_cleanup(node, identifier, region)
+
+    def _unindex_region(self, node: Node[ClientT], region: Optional[str]) -> None:
+        bucket = self._by_region[region]
+        bucket.remove(node)
+        if not bucket:
+            del self._by_region[region]
+
+    def _inject_cleanup(self, node: Node[ClientT], identifier: str, region: Optional[str]) -> None:
+        # region tracks the bucket the node is currently indexed under
         def wrapper() -> None:
-            self._nodes.pop(node.identifier, None)
+            if self._nodes_get(identifier) is not node:
+                return
+
+            del self._nodes[identifier]
+            self._unindex_region(node, region)
+
+            cache = self._player_node_cache
+            for guild_id in [guild_id for guild_id, cached in cache.items() if cached is node]:
+                del cache[guild_id]
+
+        def player_wrapper(guild_id: int) -> None:
+            if self._player_node_cache.get(guild_id) is node:
+                del self._player_node_cache[guild_id]
+
+        def region_wrapper(new_region: Optional[str]) -> None:
+            nonlocal region
+
+            if self._nodes_get(identifier) is not node or new_region == region:
+                return
+
+            self._unindex_region(node, region)
+            region = new_region
+
+            # Rebuild the bucket in pool order so that ties in get_node still go to the earliest added node
+            bucket = self._by_region.get(region, [])
+            self._by_region[region] = [other for other in self._nodes_values() if other is node or other in bucket]
 
         node._cleanup = wrapper
+        node._player_cleanup = player_wrapper
+        node._region_update = region_wrapper
 
     def __len__(self) -> int:
-        return len(self._nodes)
+        return self._nodes_len()
+
+
+# The default pool is created on first access, see __getattr__ below.
+# DefaultNodePool is also left out of __all__, otherwise star-imports would create it eagerly.
+_default_pool: Optional[NodePool[Any]] = None
+
+if TYPE_CHECKING:
+    DefaultNodePool: NodePool[Any]
 
 
-DefaultNodePool: Final[NodePool] = NodePool()
+def _get_default() -> NodePool[Any]:
+    global _default_pool, DefaultNodePool
+
+    if _default_pool is None:
+        # Also bind the module global so that later accesses skip __getattr__
+        _default_pool = DefaultNodePool = NodePool()
+
+    return _default_pool
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'DefaultNodePool':
+        return _get_default()
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
-@copy_doc(NodePool.create_node)
 def create_node(
     *,
     bot: ClientT,
@@ -424,7 +627,7 @@ def create_node(
     resume: bool = False,
     serializer: JSONSerializer[Dict[str, Any]] = json,
 ) -> Node[ClientT]:
-    return DefaultNodePool.create_node(
+    return _get_default().create_node(
         bot=bot,
         host=host,
         port=port,
@@ -440,7 +643,6 @@ def create_node(
     )
 
 
-@copy_doc(NodePool.start_node)
 def start_node(
     *,
     bot: ClientT,
@@ -456,7 +658,7 @@ def start_node(
     resume: bool = False,
     serializer: JSONSerializer[Dict[str, Any]] = json,
 ) -> Coroutine[Any, Any, Node[ClientT]]:
-    return DefaultNodePool.start_node(
+    return _get_default().start_node(
         bot=bot,
         host=host,
         port=port,
@@ -472,16 +674,20 @@ def start_node(
     )
 
 
-@copy_doc(NodePool.add_node)
 def add_node(node: Node[Any], *, identifier: Optional[str] = None) -> None:
-    DefaultNodePool.add_node(node, identifier=identifier)
+    _get_default().add_node(node, identifier=identifier)
 
 
-@copy_doc(NodePool.get_node)
 def get_node(identifier: Optional[str] = None, *, region: Optional[str] = None) -> Node[Any]:
-    return DefaultNodePool.get_node(identifier=identifier, region=region)
+    return _get_default().get_node(identifier=identifier, region=region)
 
 
-@copy_doc(NodePool.get_player)
 def get_player(guild: Snowflake, *, node: Optional[Node[ClientT]] = None) -> Player[ClientT]:
-    return DefaultNodePool.get_player(guild, node=node)
+    return _get_default().get_player(guild, node=node)
+
+
+create_node.__doc__ = NodePool.create_node.__doc__
+start_node.__doc__ = NodePool.start_node.__doc__
+add_node.__doc__ = NodePool.add_node.__doc__
+get_node.__doc__ = NodePool.get_node.__doc__
+get_player.__doc__ = NodePool.get_player.__doc__
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import cast
+
+from discord import Object
+
+from magmatic import Node, NodePool
+from magmatic.errors import AuthorizationFailure, ConnectionFailure, NoMatchingNodes, NodeConflict, PlayerNotFound
+
+
+class _FakeNode:
+    identifier = 'MAIN'
+
+
+node = cast(Node, _FakeNode())
+
+
+def test_connection_failure() -> None:
+    error = RuntimeError('refused')
+    exc = ConnectionFailure(node, error)
+
+    assert str(exc) == "Failed connecting to node 'MAIN': refused"
+    assert exc.args == (node, error)
+
+
+def test_authorization_failure() -> None:
+    exc = AuthorizationFailure(node)
+
+    assert str(exc) == "Invalid authorization passed for node 'MAIN'"
+    assert exc.args == (node,)
+
+
+def test_node_conflict() -> None:
+    pool = NodePool()
+    exc = NodeConflict(pool, 'MAIN')
+
+    assert str(exc) == "Node identifier 'MAIN' is already in use."
+    assert exc.args == (pool, 'MAIN')
+    assert repr(exc).startswith('NodeConflict(<')
+
+
+def test_no_matching_nodes() -> None:
+    pool = NodePool()
+
+    assert str(NoMatchingNodes(pool, 'MAIN', 'us')) == (
+        "No node with identifier 'MAIN' and voice region 'us' could be found in this pool."
+    )
+    assert str(NoMatchingNodes(pool, 'MAIN', None)) == "No node with identifier 'MAIN' could be found in this pool."
+    assert str(NoMatchingNodes(pool, None, 'us')) == "No node with voice region 'us' could be found in this pool."
+    assert str(NoMatchingNodes(pool, None, None)) == 'No node with no criteria could be found in this pool.'
+    assert NoMatchingNodes(pool, 'MAIN', None).args == (pool, 'MAIN', None)
+
+
+def test_player_not_found() -> None:
+    guild = Object(id=1)
+    exc = PlayerNotFound(node, guild)
+
+    assert str(exc) == f'Player for guild {guild!r} not found'
+    assert exc.args == (node, guild)
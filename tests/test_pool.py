@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, cast
+
+import pytest
+
+from discord import Client, Intents, Object
+
+from magmatic import Node, NodePool
+from magmatic.errors import NoAvailableNodes, NoMatchingNodes, NodeConflict, PlayerNotFound
+
+
+class _FakeNode:
+    def __init__(self, identifier: str, *, region: Optional[str] = None, player_count: int = 0) -> None:
+        self.identifier = identifier
+        self.player_count = player_count
+        self.players: Dict[int, Any] = {}
+        self.lookups = 0
+        self.destroyed = False
+
+        self._region = region
+        self._region_update: Any = lambda region: None
+
+    @property
+    def region(self) -> Optional[str]:
+        return self._region
+
+    @region.setter
+    def region(self, value: Optional[str]) -> None:
+        self._region = value
+        self._region_update(value)
+
+    def get_player(self, guild: Object, *, cls: Any = None, fail_if_not_exists: bool = False) -> Any:
+        self.lookups += 1
+
+        if guild.id not in self.players:
+            if fail_if_not_exists:
+                raise PlayerNotFound(cast(Node, self), guild)
+
+            self.players[guild.id] = object()
+
+        return self.players[guild.id]
+
+    async def destroy(self) -> None:
+        self.destroyed = True
+        self._cleanup()  # type: ignore
+
+
+def _node(identifier: str, *, region: Optional[str] = None, player_count: int = 0) -> Node:
+    return cast(Node, _FakeNode(identifier, region=region, player_count=player_count))
+
+
+def test_pool_nodes() -> None:
+    pool = NodePool()
+    first = _node('first')
+    second = _node('second')
+
+    pool.add_node(first)
+    pool.add_node(second)
+
+    assert pool.nodes == [first, second]
+    assert list(pool.nodes_view) == [first, second]
+    assert list(pool.walk_nodes()) == [first, second]
+    assert len(pool) == 2
+
+
+def test_pool_add_node_conflict() -> None:
+    pool = NodePool()
+    first = _node('first')
+    pool.add_node(first)
+
+    with pytest.raises(NodeConflict):
+        pool.add_node(_node('first'))
+
+    with pytest.raises(NodeConflict):
+        pool.add_node(_node('other'), identifier='first')
+
+    assert pool.nodes == [first]
+
+
+def test_pool_get_node() -> None:
+    pool = NodePool()
+
+    with pytest.raises(NoAvailableNodes):
+        pool.get_node()
+
+    busy = _node('busy', region='us', player_count=5)
+    idle = _node('idle', region='eu', player_count=1)
+    pool.add_node(busy)
+    pool.add_node(idle)
+
+    assert pool.get_node() is idle
+    assert pool.get_node('busy') is busy
+    assert pool.get_node(region='us') is busy
+
+    # Ties go to the node that was added first
+    tied = _node('tied', region='eu', player_count=1)
+    pool.add_node(tied)
+    assert pool.get_node() is idle
+    assert pool.get_node(region='eu') is idle
+
+    with pytest.raises(NoMatchingNodes):
+        pool.get_node('unknown')
+
+    with pytest.raises(NoMatchingNodes):
+        pool.get_node(region='asia')
+
+
+def test_pool_node_cleanup() -> None:
+    pool = NodePool()
+    first = _node('first', region='us')
+    second = _node('second', region='us', player_count=3)
+
+    pool.add_node(first)
+    pool.add_node(second)
+    assert pool.get_node(region='us') is first
+
+    first._cleanup()
+    assert pool.nodes == [second]
+    assert pool.get_node(region='us') is second
+
+    second._cleanup()
+    assert len(pool) == 0
+
+    with pytest.raises(NoAvailableNodes):
+        pool.get_node(region='us')
+
+
+def test_pool_node_region_change() -> None:
+    pool = NodePool()
+    first = _node('first', region='us')
+    second = _node('second', region='eu')
+    pool.add_node(first)
+    pool.add_node(second)
+
+    first.region = 'eu'
+    assert pool.get_node(region='eu') is first
+
+    with pytest.raises(NoMatchingNodes):
+        pool.get_node(region='us')
+
+    second.region = 'us'
+    assert pool.get_node(region='us') is second
+
+    first._cleanup()
+    assert pool.nodes == [second]
+    with pytest.raises(NoMatchingNodes):
+        pool.get_node(region='eu')
+
+    second._cleanup()
+    assert len(pool) == 0
+
+
+def test_pool_get_player_cache() -> None:
+    pool = NodePool()
+    first = _FakeNode('first')
+    second = _FakeNode('second')
+    pool.add_node(cast(Node, first))
+    pool.add_node(cast(Node, second))
+
+    guild = Object(id=1)
+    player = second.players[1] = object()
+
+    assert pool.get_player(guild) is player
+    assert first.lookups == second.lookups == 1
+
+    assert pool.get_player(guild) is player
+    assert first.lookups == 1
+    assert second.lookups == 2
+
+    # Player was destroyed, so the cached node should be invalidated
+    del second.players[1]
+    new = pool.get_player(guild)
+    assert new is not player
+    assert new is first.players[1]
+
+
+def test_pool_player_destroy_clears_cache() -> None:
+    pool = NodePool()
+    node = _FakeNode('node')
+    other = _FakeNode('other')
+    pool.add_node(cast(Node, node))
+    pool.add_node(cast(Node, other))
+
+    pool.get_player(Object(id=1))
+    pool.get_player(Object(id=2))
+    assert set(pool._player_node_cache) == {1, 2}
+
+    # Called by Player.destroy once the player is removed from its node
+    node._player_cleanup(1)  # type: ignore
+    assert set(pool._player_node_cache) == {2}
+
+    # Only the node the guild is cached under may clear its entry
+    other._player_cleanup(2)  # type: ignore
+    assert set(pool._player_node_cache) == {2}
+
+
+def test_pool_get_player_foreign_node() -> None:
+    pool = NodePool()
+    other_pool = NodePool()
+    own = _FakeNode('own')
+    foreign = _FakeNode('foreign')
+    pool.add_node(cast(Node, own))
+    other_pool.add_node(cast(Node, foreign))
+
+    guild = Object(id=1)
+    player = pool.get_player(guild, node=cast(Node, foreign))
+    assert player is foreign.players[1]
+    assert pool._player_node_cache == {}
+
+    new = pool.get_player(guild)
+    assert new is own.players[1]
+    assert pool._player_node_cache == {1: own}
+
+
+@pytest.mark.asyncio
+async def test_pool_destroy(caplog: pytest.LogCaptureFixture) -> None:
+    class _FailingNode(_FakeNode):
+        async def destroy(self) -> None:
+            raise RuntimeError('failed')
+
+    pool = NodePool()
+    working = _FakeNode('working', region='us')
+    pool.add_node(cast(Node, working))
+    pool.add_node(cast(Node, _FailingNode('failing')))
+    pool.get_player(Object(id=1))
+
+    with caplog.at_level(logging.ERROR, logger='magmatic.pool'):
+        await pool.destroy()
+
+    assert working.destroyed
+    assert "[Node 'failing']: Failed to destroy node: failed" in caplog.messages
+
+    assert len(pool) == 0
+    with pytest.raises(NoAvailableNodes):
+        pool.get_node(region='us')
+
+
+@pytest.mark.asyncio
+async def test_pool_shared_session() -> None:
+    pool = NodePool(connection_limit=10, connection_limit_per_host=2)
+
+    session = pool._get_session()
+    assert session is not None
+    assert pool._get_session() is session
+    assert session.connector is not None
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 2
+
+    await pool.destroy()
+    assert session.closed
+    assert pool._get_session() is not session
+
+    await pool.destroy()
+
+
+def test_pool_connection_limit_validation() -> None:
+    with pytest.raises(ValueError):
+        NodePool(connection_limit=1)
+
+    with pytest.raises(ValueError):
+        NodePool(connection_limit_per_host=1)
+
+
+@pytest.mark.asyncio
+async def test_pool_create_node_shares_session() -> None:
+    loop = asyncio.get_running_loop()
+    bot = cast(Client, SimpleNamespace(intents=Intents.default(), loop=loop))
+    pool = NodePool(connection_limit=3)
+
+    first = pool.create_node(bot=bot)
+    second = pool.create_node(bot=bot, port=2334, loop=loop)
+    assert first.connection.session is pool._session
+    assert second.connection.session is pool._session
+
+    # A third node's WebSocket would leave no connection for REST requests
+    with pytest.raises(ValueError):
+        pool.create_node(bot=bot, port=2335)
+
+    # Nodes on a different event loop get their own session
+    other_loop = asyncio.new_event_loop()
+    try:
+        third = pool.create_node(bot=bot, port=2335, loop=other_loop, identifier='other')
+        assert third.connection.session is not pool._session
+        await third.connection.session.close()
+    finally:
+        other_loop.close()
+
+    session = pool._session
+    assert session is not None
+
+    await pool.destroy()
+    assert session.closed